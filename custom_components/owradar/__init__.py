@@ -5,6 +5,9 @@ https://github.com/zomco/owradar-integration
 """
 from __future__ import annotations
 
+import asyncio
+import importlib
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -22,7 +25,18 @@ PLATFORMS: list[Platform] = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OwRadar from a config entry."""
     coordinator = OwRadarDataUpdateCoordinator(hass, entry=entry)
-    await coordinator.async_config_entry_first_refresh()
+
+    # Import the platforms in the executor while the first refresh waits on
+    # the device, so the forward below does not have to.
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        *(
+            hass.async_add_import_executor_job(
+                importlib.import_module, f"{__name__}.{platform}"
+            )
+            for platform in PLATFORMS
+        ),
+    )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
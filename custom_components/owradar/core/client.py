@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import socket
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -11,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 import aiohttp
 import async_timeout
 import backoff
-from cachetools import TTLCache
+import orjson
 from yarl import URL
 
 from .exceptions import (
@@ -21,12 +20,18 @@ from .exceptions import (
     OwRadarError,
     OwRadarTimeoutConnectionError,
 )
-from .r60abd1_models import OwRadarR60abd1Device, OwRadarR60abd1Setting
+from .r60abd1_models import OwRadarR60abd1Device
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-VERSION_CACHE: TTLCache[str, str | None] = TTLCache(maxsize=16, ttl=7200)
+WS_CLOSED_TYPES = frozenset(
+    (
+        aiohttp.WSMsgType.CLOSE,
+        aiohttp.WSMsgType.CLOSED,
+        aiohttp.WSMsgType.CLOSING,
+    )
+)
 
 
 @dataclass
@@ -194,20 +199,20 @@ class OwRadarClient:
         self, client: aiohttp.ClientWebSocketResponse, callback: Callable[[Any], None]
     ) -> None:
         """Listen for events on the WebSocket."""
+        receive = client.receive
         while not client.closed:
-            message = await client.receive()
+            message = await receive()
+            message_type = message.type
 
-            if message.type == aiohttp.WSMsgType.ERROR:
-                raise OwRadarConnectionError(client.exception())
+            # Data frames are by far the most frequent, check them first.
+            if message_type == aiohttp.WSMsgType.TEXT:
+                callback(orjson.loads(message.data))
+                continue
 
-            if message.type == aiohttp.WSMsgType.TEXT:
-                callback(message.json())
+            if message_type == aiohttp.WSMsgType.ERROR:
+                raise OwRadarConnectionError(client.exception())
 
-            if message.type in (
-                aiohttp.WSMsgType.CLOSE,
-                aiohttp.WSMsgType.CLOSED,
-                aiohttp.WSMsgType.CLOSING,
-            ):
+            if message_type in WS_CLOSED_TYPES:
                 msg = f"Connection to the WebSocket on {self.host} has been closed"
                 raise OwRadarClosedConnectionError(msg)
 
@@ -410,7 +415,7 @@ class OwRadarClient:
                 if content_type == "application/json":
                     raise OwRadarError(  # noqa: TRY301
                         response.status,
-                        json.loads(contents.decode("utf8")),
+                        orjson.loads(contents),
                     )
                 raise OwRadarError(  # noqa: TRY301
                     response.status,
@@ -418,7 +423,7 @@ class OwRadarClient:
                 )
 
             if "application/json" in content_type:
-                response_data = await response.json()
+                response_data = await response.json(loads=orjson.loads)
             else:
                 response_data = await response.text()
 
@@ -475,9 +480,13 @@ class OwRadarClient:
                     f"device at {self.host} returned an invalid response missing field `info.radar_model` on full update",
                 )
                 raise OwRadarEmptyResponseError(msg)
-            self._device = {}
+            # Keep the current device on full updates, so its models (and the
+            # nested ones the entities read) are updated in place.
             if radar_model == "r60abd1":
-                self._device = OwRadarR60abd1Device()
+                if not isinstance(self._device, OwRadarR60abd1Device):
+                    self._device = OwRadarR60abd1Device()
+            else:
+                self._device = {}
             self._device.update_from_dict(data)
             return self._device
 
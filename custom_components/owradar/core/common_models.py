@@ -2,47 +2,88 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import IntEnum
-from typing import Any
+from typing import Any, TypeVar, get_type_hints
 
+_ModelT = TypeVar("_ModelT")
 
-@dataclass
-class OwRadarCommonEvent:
+
+def with_updater(cls: type[_ModelT]) -> type[_ModelT]:
     """
-    Object holding State Information from OwRadar.
+    Generate the `update_from_dict` method of a model dataclass.
+
+    The method is compiled once per class from its dataclass fields, so a
+    frame update runs as straight-line code. A field is read from the key
+    named in its `key` metadata, or from its own name otherwise. Keys that
+    are missing or null leave the field untouched, enum fields are looked up
+    in a table of their members bound to the method, rather than calling the
+    enum for every frame, and nested models are updated in place.
 
     Args:
     ----
-        data: The data from the OwRadar device API.
+        cls: The model dataclass to generate the method for.
 
     Returns:
     -------
-        A State object.
+        The same class, with `update_from_dict` set.
 
     """
+    hints = get_type_hints(cls)
+    tables: dict[str, dict[int, IntEnum]] = {}
+    lines = ["    def update_from_dict(self, data):", "        get = data.get"]
+    for fld in fields(cls):
+        name = fld.name
+        hint = hints[name]
+        lines.append(
+            f"        if (value := get({fld.metadata.get('key', name)!r})) is not None:"
+        )
+        if isinstance(hint, type) and issubclass(hint, IntEnum):
+            tables[f"_{name}_members"] = {member.value: member for member in hint}
+            lines.append(f"            self.{name} = _{name}_members[value]")
+        elif hasattr(hint, "update_from_dict"):
+            lines.append(f"            self.{name}.update_from_dict(value)")
+        else:
+            lines.append(f"            self.{name} = value")
+    lines.append("        return self")
+
+    # Build the method inside a factory taking the enum tables as arguments,
+    # so it reads them as closure cells instead of looking up globals.
+    lines.insert(0, f"def __create_fn__({', '.join(tables)}):")
+    lines.append("    return update_from_dict")
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+
+    update_from_dict = namespace["__create_fn__"](**tables)
+    update_from_dict.__qualname__ = f"{cls.__qualname__}.update_from_dict"
+    update_from_dict.__doc__ = (
+        f"Update and Return {cls.__name__} from OwRadar API response."
+    )
+    cls.update_from_dict = update_from_dict  # type: ignore[attr-defined]
+    return cls
 
-    timestamp: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonEvent:
-        """
-        Update Return State object form OwRadar API response.
+@with_updater
+@dataclass(slots=True)
+class OwRadarCommonEvent:
+    """
+    Object holding State Information from OwRadar.
 
-        Args:
-        ----
-            data: The response from the OwRadar API.
+    Args:
+    ----
+        data: The data from the OwRadar device API.
 
-        Returns:
-        -------
-            An State object.
+    Returns:
+    -------
+        A State object.
 
-        """
-        self.timestamp = data.get("timestamp", self.timestamp)
+    """
 
-        return self
+    timestamp: int = 0
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonSnap:
     """
     Object holding State Information from OwRadar.
@@ -59,25 +100,9 @@ class OwRadarCommonSnap:
 
     timestamp: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonSnap:
-        """
-        Update Return State object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An State object.
 
-        """
-        self.timestamp = data.get("timestamp", self.timestamp)
-
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonStats:
     """
     Object holding State Information from OwRadar.
@@ -94,51 +119,18 @@ class OwRadarCommonStats:
 
     timestamp: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonStats:
-        """
-        Update Return State object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An State object.
-
-        """
-        self.timestamp = data.get("timestamp", self.timestamp)
-
-        return self
 
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonStateMotionAngle:
     """Object holding Motion Angle state in OwRadar."""
 
     pitch: float = 0
     roll: float = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonStateMotionAngle:
-        """
-        Return Motion Angle object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Motion Angle object.
-
-        """
-        self.pitch = data.get("pitch", self.pitch)
-        self.roll = data.get("roll", self.roll)
 
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonStateMotion:
     """Object holding motion state in OwRadar."""
 
@@ -146,25 +138,9 @@ class OwRadarCommonStateMotion:
         default_factory=OwRadarCommonStateMotionAngle
     )
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonStateMotion:
-        """
-        Update and Return Motion object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
 
-        Returns:
-        -------
-            An Motion object.
-
-        """
-        self.angle = self.angle.update_from_dict(data.get("angle", self.angle.__dict__))
-
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonState:
     """
     Object holding State Information from device.
@@ -182,34 +158,15 @@ class OwRadarCommonState:
     timestamp: int = 0
     motion: OwRadarCommonStateMotion = field(default_factory=OwRadarCommonStateMotion)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonState:
-        """
-        Update Return State object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An State object.
-
-        """
-        self.timestamp = data.get("timestamp", self.timestamp)
-        self.motion = self.motion.update_from_dict(
-            data.get("motion", self.motion.__dict__)
-        )
-
-        return self
 
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonInfo:
     """Object holding device information from OwRadar."""
 
     radar_model: str = ""
     radar_version: str = ""
-    mac_addr: str = ""
+    mac_addr: str = field(default="", metadata={"key": "mac"})
     name: str = ""
     ip: str = ""
     free_heap: int = 0
@@ -219,33 +176,6 @@ class OwRadarCommonInfo:
     product: str = ""
     board: str = ""
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonInfo:
-        """
-        Update and Return Device information object from OwRadar API response.
-
-        Args:
-        ----
-            data: The data from the OwRadar device API.
-
-        Returns:
-        -------
-            A Device information object.
-
-        """
-        self.radar_model = data.get("radar_model", self.radar_model)
-        self.radar_version = data.get("radar_version", self.radar_version)
-        self.mac_addr = data.get("mac", self.mac_addr)
-        self.name = data.get("name", self.name)
-        self.ip = data.get("ip", self.ip)
-        self.free_heap = data.get("free_heap", self.free_heap)
-        self.version = data.get("version", self.version)
-        self.architecture = data.get("architecture", self.architecture)
-        self.brand = data.get("brand", self.brand)
-        self.product = data.get("product", self.product)
-        self.board = data.get("board", self.board)
-
-        return self
-
 
 class OwRadarCommonSettingSwitch(IntEnum):
     """Enumeration representing switch state from OwRadar."""
@@ -254,7 +184,8 @@ class OwRadarCommonSettingSwitch(IntEnum):
     ON = 1
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonSetting:
     """
     Object holding Common Setting information from OwRadar.
@@ -285,57 +216,10 @@ class OwRadarCommonSetting:
     indicate: OwRadarCommonSettingSwitch = OwRadarCommonSettingSwitch.OFF
     interval: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonSetting:
-        """
-        Update and Return Setting object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Setting object.
-
-        """
-        self.broker = data.get("broker", self.broker)
-        self.gatt_state = data.get("gatt_state", self.gatt_state)
-        self.mqtt_state = data.get("mqtt_state", self.mqtt_state)
-        self.websocket_state = data.get("websocket_state", self.websocket_state)
-        self.gatt_stats = data.get("gatt_stats", self.gatt_stats)
-        self.mqtt_stats = data.get("mqtt_stats", self.mqtt_stats)
-        self.websocket_stats = data.get("websocket_stats", self.websocket_stats)
-        self.gatt_event = data.get("gatt_event", self.gatt_event)
-        self.mqtt_event = data.get("mqtt_event", self.mqtt_event)
-        self.websocket_event = data.get("websocket_event", self.websocket_event)
-        self.gatt_snap = data.get("gatt_snap", self.gatt_snap)
-        self.mqtt_snap = data.get("mqtt_snap", self.mqtt_snap)
-        self.websocket_snap = data.get("websocket_snap", self.websocket_snap)
-        self.indicate = data.get("indicate", self.indicate)
-        self.interval = data.get("interval", self.interval)
-
-        return self
-
-
-@dataclass
+
+@with_updater
+@dataclass(slots=True)
 class OwRadarCommonDevice:
     """Object holding device information from OwRadar."""
 
     info: OwRadarCommonInfo = field(default_factory=OwRadarCommonInfo)
-
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarCommonDevice:
-        """
-        Update and Return Device information object from OwRadar API response.
-
-        Args:
-        ----
-            data: The data from the OwRadar device API.
-
-        Returns:
-        -------
-            A Device information object.
-
-        """
-        self.info.update_from_dict(data.get("info", self.info.__dict__))
-
-        return self
@@ -4,40 +4,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any
 
 from .common_models import (
     OwRadarCommonDevice,
     OwRadarCommonSetting,
     OwRadarCommonSettingSwitch,
     OwRadarCommonState,
+    with_updater,
 )
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1Event:
     """Object holding body location state in OwRadar."""
 
     status: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Event:
-        """
-        Return Body Location object form OwRadar API response.
 
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.status = data.get("status", self.status)
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1Snap:
     """Object holding body location state in OwRadar."""
 
@@ -52,33 +38,9 @@ class OwRadarR60abd1Snap:
     breath_rate: int = 0
     sleep_away: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Snap:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.body_range = data.get("body_range", self.body_range)
-        self.body_presence = data.get("body_presence", self.body_presence)
-        self.body_energy = data.get("body_energy", self.body_energy)
-        self.body_movement = data.get("body_movement", self.body_movement)
-        self.body_distance = data.get("body_distance", self.body_distance)
-        self.body_location_x = data.get("body_location_x", self.body_location_x)
-        self.body_location_y = data.get("body_location_y", self.body_location_y)
-        self.heart_rate = data.get("heart_rate", self.heart_rate)
-        self.breath_rate = data.get("breath_rate", self.breath_rate)
-        self.sleep_away = data.get("sleep_away", self.sleep_away)
-        return self
-
-
-@dataclass
+
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1Stats:
     """Object holding body location state in OwRadar."""
 
@@ -87,25 +49,6 @@ class OwRadarR60abd1Stats:
     heart: int = 0
     turn: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Stats:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.status = data.get("status", self.status)
-        self.breath = data.get("breath", self.breath)
-        self.heart = data.get("heart", self.heart)
-        self.turn = data.get("turn", self.turn)
-        return self
-
 
 class OwRadarR60abd1StateBodyRange(IntEnum):
     """Enumeration representing body range from OwRadar."""
@@ -129,7 +72,8 @@ class OwRadarR60abd1StateBodyMovement(IntEnum):
     ACTIVE = 2
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateBodyLocation:
     """Object holding body location state in OwRadar."""
 
@@ -137,26 +81,9 @@ class OwRadarR60abd1StateBodyLocation:
     y: int = 0
     z: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBodyLocation:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.x = data.get("x", self.x)
-        self.y = data.get("y", self.y)
-        self.z = data.get("z", self.z)
-        return self
 
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateBody:
     """Object holding body state in OwRadar."""
 
@@ -169,36 +96,9 @@ class OwRadarR60abd1StateBody:
         default_factory=OwRadarR60abd1StateBodyLocation
     )
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBody:
-        """
-        Update and Return Body object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body object.
 
-        """
-        self.range = OwRadarR60abd1StateBodyRange(data.get("range", self.range.value))
-        self.presence = OwRadarR60abd1StateBodyPresence(
-            data.get("presence", self.presence.value)
-        )
-        self.energy = data.get("energy", self.energy)
-        self.movement = OwRadarR60abd1StateBodyMovement(
-            data.get("movement", self.movement.value)
-        )
-        self.distance = data.get("distance", self.distance)
-        self.location = self.location.update_from_dict(
-            data.get("location", self.location.__dict__)
-        )
-
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateWaves:
     """Object holding wave state in OwRadar."""
 
@@ -208,53 +108,15 @@ class OwRadarR60abd1StateWaves:
     w3: int = 0
     w4: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateWaves:
-        """
-        Update and Return Heart object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Heart object.
-
-        """
-        self.w0 = data.get("w0", self.w0)
-        self.w1 = data.get("w1", self.w1)
-        self.w2 = data.get("w2", self.w2)
-        self.w3 = data.get("w3", self.w3)
-        self.w4 = data.get("w4", self.w4)
-
-        return self
 
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateHeart:
     """Object holding heart state in OwRadar."""
 
     rate: int = 0
     waves: OwRadarR60abd1StateWaves = field(default_factory=OwRadarR60abd1StateWaves)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateHeart:
-        """
-        Update and Return Heart object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Heart object.
-
-        """
-        self.rate = data.get("rate", self.rate)
-        self.waves = self.waves.update_from_dict(data.get("waves", self.waves.__dict__))
-
-        return self
-
 
 class OwRadarR60abd1StateBreathInfo(IntEnum):
     """Enumeration representing breath info from OwRadar."""
@@ -266,7 +128,8 @@ class OwRadarR60abd1StateBreathInfo(IntEnum):
     NONE = 4
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateBreath:
     """Object holding breath state in OwRadar."""
 
@@ -274,25 +137,6 @@ class OwRadarR60abd1StateBreath:
     rate: int = 0
     waves: OwRadarR60abd1StateWaves = field(default_factory=OwRadarR60abd1StateWaves)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBreath:
-        """
-        Update and Return Breath object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Breath object.
-
-        """
-        self.info = OwRadarR60abd1StateBreathInfo(data.get("info", self.info))
-        self.rate = data.get("rate", self.rate)
-        self.waves = self.waves.update_from_dict(data.get("waves", self.waves.__dict__))
-
-        return self
-
 
 class OwRadarR60abd1StateSleepAway(IntEnum):
     """Enumeration representing sleep away from OwRadar."""
@@ -345,7 +189,8 @@ class OwRadarR60abd1StateSleepNobody(IntEnum):
     ABNORMAL = 2
 
 
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateSleepOverview:
     """
     Object holding sleep overview state in OwRadar.
@@ -369,36 +214,9 @@ class OwRadarR60abd1StateSleepOverview:
     seratio: int = 0
     pause: int = 0
 
-    def update_from_dict(
-        self, data: dict[str, Any]
-    ) -> OwRadarR60abd1StateSleepOverview:
-        """
-        Return SleepOverview object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An SleepOverview object.
-
-        """
-        self.presence = OwRadarR60abd1StateBodyPresence(
-            data.get("presence", self.presence)
-        )
-        self.status = OwRadarR60abd1StateSleepStatus(data.get("status", self.status))
-        self.heart = data.get("heart", self.heart)
-        self.breath = data.get("breath", self.breath)
-        self.turn = data.get("turn", self.turn)
-        self.leratio = data.get("leratio", self.leratio)
-        self.seratio = data.get("seratio", self.seratio)
-        self.pause = data.get("pause", self.pause)
-
-        return self
 
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateSleepQuality:
     """
     Object holding sleep quality state in OwRadar.
@@ -425,35 +243,9 @@ class OwRadarR60abd1StateSleepQuality:
     heart: int = 0
     pause: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateSleepQuality:
-        """
-        Return SleepQuality object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An SleepQuality object.
-
-        """
-        self.score = data.get("score", self.score)
-        self.duration = data.get("duration", self.duration)
-        self.awake = data.get("awake", self.awake)
-        self.light = data.get("light", self.light)
-        self.deep = data.get("deep", self.deep)
-        self.aduration = data.get("aduration", self.aduration)
-        self.away = data.get("away", self.away)
-        self.turn = data.get("turn", self.turn)
-        self.breath = data.get("breath", self.breath)
-        self.heart = data.get("heart", self.heart)
-        self.pause = data.get("pause", self.pause)
 
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1StateSleep:
     """
     Object holding sleep state in OwRadar.
@@ -487,44 +279,9 @@ class OwRadarR60abd1StateSleep:
     struggle: OwRadarR60abd1StateSleepStruggle = OwRadarR60abd1StateSleepStruggle.NONE
     nobody: OwRadarR60abd1StateSleepNobody = OwRadarR60abd1StateSleepNobody.NONE
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateSleep:
-        """
-        Update and Return Sleep object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Sleep object.
-
-        """
-        self.away = OwRadarR60abd1StateSleepAway(data.get("away", self.away))
-        self.status = OwRadarR60abd1StateSleepStatus(data.get("status", self.status))
-        self.awake = data.get("awake", self.awake)
-        self.light = data.get("light", self.light)
-        self.deep = data.get("deep", self.deep)
-        self.score = data.get("score", self.score)
-        self.overview = self.overview.update_from_dict(
-            data.get("overview", self.overview.__dict__)
-        )
-        self.quality = self.quality.update_from_dict(
-            data.get("quality", self.quality.__dict__)
-        )
-        self.exception = OwRadarR60abd1StateSleepException(
-            data.get("exception", self.exception)
-        )
-        self.rating = OwRadarR60abd1StateSleepRating(data.get("rating", self.rating))
-        self.struggle = OwRadarR60abd1StateSleepStruggle(
-            data.get("struggle", self.struggle)
-        )
-        self.nobody = OwRadarR60abd1StateSleepNobody(data.get("nobody", self.nobody))
-
-        return self
-
-
-@dataclass
+
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1State(OwRadarCommonState):
     """
     Object holding State Information from OwRadar.
@@ -544,29 +301,9 @@ class OwRadarR60abd1State(OwRadarCommonState):
     breath: OwRadarR60abd1StateBreath = field(default_factory=OwRadarR60abd1StateBreath)
     sleep: OwRadarR60abd1StateSleep = field(default_factory=OwRadarR60abd1StateSleep)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1State:
-        """
-        Update Return State object form OwRadar API response.
 
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An State object.
-
-        """
-        super().update_from_dict(data)
-        self.body.update_from_dict(data.get("body", self.body.__dict__))
-        self.breath.update_from_dict(data.get("breath", self.breath.__dict__))
-        self.heart.update_from_dict(data.get("heart", self.heart.__dict__))
-        self.sleep.update_from_dict(data.get("sleep", self.sleep.__dict__))
-
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1Setting(OwRadarCommonSetting):
     """
     Object holding R60ABD1 Setting information from OwRadar.
@@ -591,34 +328,9 @@ class OwRadarR60abd1Setting(OwRadarCommonSetting):
     struggle: OwRadarCommonSettingSwitch = OwRadarCommonSettingSwitch.OFF
     stop_duration: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Setting:
-        """
-        Update and Return Device information object from OwRadar API response.
-
-        Args:
-        ----
-            data: The data from the OwRadar device API.
-
-        Returns:
-        -------
-            A Device information object.
 
-        """
-        super().update_from_dict(data)
-        self.body = data.get("body", self.body)
-        self.heart = data.get("heart", self.heart)
-        self.breath = data.get("breath", self.breath)
-        self.sleep = data.get("sleep", self.sleep)
-        self.mode = data.get("mode", self.mode)
-        self.nobody = data.get("nobody", self.nobody)
-        self.nobody_duration = data.get("nobody_duration", self.nobody_duration)
-        self.struggle = data.get("struggle", self.struggle)
-        self.stop_duration = data.get("stop_duration", self.stop_duration)
-
-        return self
-
-
-@dataclass
+@with_updater
+@dataclass(slots=True)
 class OwRadarR60abd1Device(OwRadarCommonDevice):
     """
     Object holding Device Information from OwRadar.
@@ -638,21 +350,3 @@ class OwRadarR60abd1Device(OwRadarCommonDevice):
     stats: OwRadarR60abd1Stats = field(default_factory=OwRadarR60abd1Stats)
     snap: OwRadarR60abd1Snap = field(default_factory=OwRadarR60abd1Snap)
     event: OwRadarR60abd1Event = field(default_factory=OwRadarR60abd1Event)
-
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Device:
-        """
-        Update and Return Device object from OwRadar API response.
-
-        Args:
-        ----
-            data: Update the device object with the data received from a
-                OwRadar device API.
-
-        Returns:
-        -------
-            The updated Device object.
-
-        """
-        super().update_from_dict(data)
-        self.setting.update_from_dict(data.get("setting", self.setting.__dict__))
-        return self